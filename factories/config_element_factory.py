@@ -1,4 +1,4 @@
-from typing import Generator, List, Dict, Tuple, Any
+from typing import List, Dict, Tuple, Any
 
 from models.target_element import TargetElement
 
@@ -9,34 +9,33 @@ class ConfigElementFactory:
     NO_REF_ELEMENT = 'no_ref_element'
 
     @staticmethod
-    def create_elements(generator: Generator[Tuple[str, Dict[Any, Any]], None, None], data_order: List[str]) \
+    def create_elements(raw_elements: List[Tuple[str, Dict[Any, Any]]], data_order: List[str]) \
             -> List[TargetElement]:
         """
-        Creates elements based on the provided generator and sorts them according to the data order.
+        Creates elements based on the provided raw elements and sorts them according to the data order.
 
-        :param generator: A generator yielding element type and data.
+        :param raw_elements: A list of element type and data pairs.
         :param data_order: The order elements should be in.
 
         :return: List[TargetElement]: List containing created and sorted elements.
         """
-        elements = ConfigElementFactory._create_elements(generator)
+        elements = ConfigElementFactory._create_elements(raw_elements)
         ConfigElementFactory._sort_elements(elements, data_order)
 
         return elements
 
     @staticmethod
-    def _create_elements(generator: Generator[Tuple[str, Dict[str, str]], None, None]) \
-            -> List[TargetElement]:
+    def _create_elements(raw_elements: List[Tuple[str, Dict[str, str]]]) -> List[TargetElement]:
         """
-        Create and return a list of elements based on the provided generator.
+        Create and return a list of elements based on the provided raw elements.
 
-        :param generator: A generator yielding element type and data.
+        :param raw_elements: A list of element type and data pairs.
 
         :return: List[TargetElement]: List of created elements.
         """
         elements = []
 
-        for element_type, element_data in generator:
+        for element_type, element_data in raw_elements:
             element_id = element_data.get('id', ConfigElementFactory.INVALID_ID)
             element_name = element_data.get('name', ConfigElementFactory.NO_REF_ELEMENT)
 
@@ -64,30 +63,31 @@ class ConfigElementFactory:
 
         :return: TargetElement: The created TargetElement.
         """
-        formatted_attrs = TargetElement.collect_attributes(element_data.get('attributes', []))
+        raw_attrs = element_data.get('attributes', [])
         search_hierarchy = element_data.get('search_hierarchy', [])
 
-        if search_hierarchy and formatted_attrs:
+        if search_hierarchy and raw_attrs:
             raise ValueError(
                 f'Improperly formatted element, you cannot specify a search hierarchy and, '
                 f'attributes on the same element: {element_data}'
             )
 
-        target_element = TargetElement(element_name, element_id)
+        target_element = TargetElement(element_name, element_id,
+                                       stepwise_search=element_data.get('stepwise_search', False))
 
-        if not formatted_attrs:
+        if not raw_attrs:
             css_selector = element_data.get('css_selector', '')
 
             if css_selector:
-                formatted_attrs = TargetElement.collect_attributes([{'css_selector': css_selector}])
+                raw_attrs = [{'css_selector': css_selector}]
 
         # Convert attributes into a search hierarchy to simplify the scraping process.
         if search_hierarchy:
             target_element.search_hierarchy = TargetElement.create_search_hierarchy_from_raw_hierarchy(search_hierarchy)
-        elif formatted_attrs:
-            target_element.create_search_hierarchy_from_attributes(formatted_attrs)
+        elif raw_attrs:
+            target_element.create_search_hierarchy_from_attributes(TargetElement.collect_attributes(raw_attrs))
         else:
-            raise ValueError(f'Missing either a search hierarchy or a attribute selector {formatted_attrs}')
+            raise ValueError(f'Missing either a search hierarchy or a attribute selector {element_data}')
 
         return target_element
 
@@ -99,4 +99,5 @@ class ConfigElementFactory:
         :param element_selectors: List of SelectorElement or TargetElement.
         :param data_order: The desired order of elements.
         """
-        element_selectors.sort(key=lambda x: data_order.index(x.name))
+        order_map = {name: index for index, name in enumerate(data_order)}
+        element_selectors.sort(key=lambda x: order_map[x.name])
@@ -1,6 +1,7 @@
-import json
 import logging
+import orjson
 
+from types import MappingProxyType
 from typing import Dict, List, Any, Tuple, Generator
 
 from loaders.response_loader import ResponseLoader
@@ -8,6 +9,8 @@ from scraping.crawler import Crawler
 from utils.clogger import CLogger
 from utils.deserializer import Deserializer
 
+DEFAULT_URL_OPTIONS = MappingProxyType({'only_scrape_sub_pages': True, 'render_pages': False})
+
 
 class ConfigLoader:
     """
@@ -22,10 +25,13 @@ class ConfigLoader:
         _total_elements (int): Total number of elements.
         _element_names (set): Set of element names.
         _target_url_table (dict): Table of target URLs and their options.
-        _parsing_options_cache (dict): Cache for data parsing options.
+        _raw_elements (list): Materialized raw target elements.
+        _parsing_options_cache (dict): Data parsing options indexed by element ID.
     """
 
     def __init__(self, config_file_path: str):
+        self._logger = CLogger("ConfigLoader", logging.INFO, {logging.StreamHandler(): logging.INFO})
+
         self.config_file_path = config_file_path
 
         self.config_data = self.load_config()
@@ -34,12 +40,11 @@ class ConfigLoader:
         self._element_names = set()
 
         self._target_url_table = {}
+        self._raw_elements = []
         self._parsing_options_cache = {}
 
-        self._build_target_url_table()
         self.format_config()
-
-        self._logger = CLogger("ConfigLoafer", logging.INFO, {logging.StreamHandler(): logging.INFO})
+        self._build_parsing_options_cache()
 
     def load_config(self) -> dict:
         """
@@ -50,14 +55,14 @@ class ConfigLoader:
 
         Raises:
             FileNotFoundError: If the configuration file is not found.
-            json.JSONDecodeError: If there's an issue with JSON decoding.
+            ValueError: If there's an issue with JSON decoding.
         """
         try:
-            with open(self.config_file_path) as file:
-                return json.load(file)
+            with open(self.config_file_path, 'rb') as file:
+                return orjson.loads(file.read())
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Config file not found: {self.config_file_path}") from e
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Failed to decode JSON in config file: {self.config_file_path}") from e
 
     def get_target_urls(self) -> List[str]:
@@ -118,24 +123,15 @@ class ConfigLoader:
         if self._target_url_table:
             return self._target_url_table.get(url, {}).get('only_scrape_sub_pages', False)
 
-    def get_raw_target_elements(self) -> Generator[Tuple[str, Dict[Any, Any]], None, None]:
+    def get_raw_target_elements(self) -> List[Tuple[str, Dict[Any, Any]]]:
         """
-        Generate raw target elements or selectors from the configuration.
+        Get the raw target elements or selectors from the configuration.
 
-        Yields:
-            Tuple[str, Dict[Any, Any]]: A tuple where the first element is 'target' or 'selector',
-                                       and the second element is the raw element configuration.
+        Returns:
+            List[Tuple[str, Dict[Any, Any]]]: Tuples where the first element is 'target' or 'selector',
+                                             and the second element is the raw element configuration.
         """
-        elements = self.config_data.get("elements", [])
-
-        for element in elements:
-            element_type = "BAD SELECTOR"
-            # we treat search hierarchies the same as target elements as all target elements are
-            # formatted into search hierarchies
-            if element.get('search_hierarchy', '') or element.get('css_selector', ''):
-                element_type = "target"
-
-            yield element_type, element
+        return self._raw_elements
 
     def get_data_parsing_options(self, element_id: int) -> dict:
         """
@@ -147,24 +143,7 @@ class ConfigLoader:
         Returns:
             dict: Data parsing options for the element.
         """
-        options = self._parsing_options_cache.get(element_id)
-
-        if options:
-            return options
-
-        for _, element in self.get_raw_target_elements():
-            if element.get("id") != element_id:
-                continue
-
-            element_parsing_data = element.get('data_parsing', '')
-            if not element_parsing_data:
-                self._logger.info(f"element has no data parsing options specified, collect data will be ignored: {element}")
-            else:
-                self._parsing_options_cache.update({element_id: element_parsing_data})
-
-            return element_parsing_data
-
-        return {}
+        return self._parsing_options_cache.get(element_id, {})
 
     def get_saving_data(self) -> Dict[Any, Any]:
         """
@@ -192,33 +171,54 @@ class ConfigLoader:
                 if element_name not in data_order:
                     data_order.append(element_name)
 
+        seen = set()
         unique_data_order = []
         for item in data_order:
-            if item not in unique_data_order:
-                unique_data_order.append(item)
+            if item in seen:
+                continue
             if item not in self._element_names:
                 raise ValueError(f"Unknown name in data-order: {item}")
+            seen.add(item)
+            unique_data_order.append(item)
         return unique_data_order
 
     def format_config(self) -> None:
         """
-        Format the configuration data by setting defaults and IDs for elements.
+        Format the configuration data in a single pass: build the target URL table, then set the IDs and
+        default names of the elements and classify them.
         """
-        for index, (_, element) in enumerate(self.get_raw_target_elements()):
+        for url_data in self.config_data.get('target_urls', []):
+            url = url_data.get('url')
+            options = url_data.get('options', {})
+            self._target_url_table[url] = self._build_options(url, options)
+
+        elements = self.config_data.get("elements", [])
+        self._total_elements = len(elements)
+
+        for index, element in enumerate(elements):
             element["id"] = index
-            element_name = element.get('name', None)
-            if not element_name:
+            if not element.get('name'):
                 element["name"] = f"element {index}"
-            self._element_names.add(element_name)
+            self._element_names.add(element["name"])
+
+            element_type = "BAD SELECTOR"
+            # we treat search hierarchies the same as target elements as all target elements are
+            # formatted into search hierarchies
+            if element.get('search_hierarchy', '') or element.get('css_selector', ''):
+                element_type = "target"
+
+            self._raw_elements.append((element_type, element))
 
-    def _build_target_url_table(self) -> None:
+    def _build_parsing_options_cache(self) -> None:
         """
-        Build the target URL table using configuration data.
+        Index the data parsing options of every element by its ID.
         """
-        for url_data in self.config_data.get('target_urls', []):
-            url = url_data.get('url')
-            options = url_data.get('options', {})
-            self._target_url_table.update({url: self._build_options(url, options)})
+        for _, element in self._raw_elements:
+            element_parsing_data = element.get('data_parsing', {})
+            if not element_parsing_data:
+                self._logger.info(f"element has no data parsing options specified, collect data will be ignored: {element}")
+
+            self._parsing_options_cache[element["id"]] = element_parsing_data or {}
 
     def _build_options(self, url: str, options: Dict) -> Dict[str, bool]:
         """
@@ -231,11 +231,10 @@ class ConfigLoader:
         Returns:
             Dict[str, bool]: Built options.
         """
-        DEFAULT_OPTIONS = {'only_scrape_sub_pages': True, 'render_pages': False}
-        for option in DEFAULT_OPTIONS:
-            if options.get(option) is None:
-                self._logger.warning(
-                    f"missing options argument in target url: {url} missing option: {option}, defaulting to {DEFAULT_OPTIONS[option]}"
-                )
-                options.update({option: DEFAULT_OPTIONS[option]})
-        return options
+        missing_options = [option for option in DEFAULT_URL_OPTIONS if options.get(option) is None]
+
+        if missing_options and self._logger.isEnabledFor(logging.WARNING):
+            defaults = ', '.join(f"{option}={DEFAULT_URL_OPTIONS[option]}" for option in missing_options)
+            self._logger.warning(f"missing options arguments in target url: {url}, defaulting to: {defaults}")
+
+        return {**options, **{option: DEFAULT_URL_OPTIONS[option] for option in missing_options}}
@@ -1,9 +1,11 @@
 import aiohttp
 import asyncio
+import codecs
 import logging
 
 from enum import Enum
-from typing import Coroutine, Dict, AsyncGenerator, List, Set, Tuple, Generator, Any
+from functools import lru_cache
+from typing import Callable, Coroutine, Dict, AsyncGenerator, Iterable, List, Tuple, Generator, Any, Union, Optional
 from aiohttp import ClientTimeout
 from urllib.parse import urlsplit, urlunsplit, urljoin, urlparse
 from playwright.async_api import Page, Request, Locator
@@ -13,28 +15,83 @@ from EVNTDispatch import EventDispatcher, PEvent, EventType
 from scraping.page_manager import BrowserManager
 from utils.clogger import CLogger
 
+# the crawler resolves the same base urls and navigation hrefs over and over, so the
+# pure url helpers below are memoized
+_URL_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _normalize_url(url: str) -> str:
+    components = urlsplit(url)
+    normalized_components = [
+        components.scheme.lower(),
+        components.netloc.lower(),
+        components.path,
+        components.query,
+        components.fragment
+    ]
+    return urlunsplit(normalized_components)
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _build_link(base_url: str, href: str) -> str:
+    return _normalize_url(urljoin(base_url, href))
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _get_domain(url: str) -> str:
+    return urlparse(url).netloc
+
 
 class ScrapedResponse:
     def __init__(self, html: str, status_code: int, url: str, href_elements: List[Locator] = None,
-                 page: Page = None):
+                 page: Page = None, utf8_body: bytes = None, parser: HTMLParser = None):
         self.html: str = html
         self.status_code: int = status_code
         self.url: str = url
         self.href_elements: List[Locator] = href_elements
         self.page: Page = page
+        # the undecoded body, only kept when it is utf-8 so it can be handed to the parser as is
+        self.utf8_body: bytes = utf8_body
+
+        # a response can come with its tree already built when parsing was needed to detect the encoding
+        self._parser: HTMLParser = parser
+
+    @property
+    def parser(self) -> HTMLParser:
+        """
+        The parsed html, built on first access and shared by everything that reads this response.
+        """
+        return self.parse()
+
+    def parse(self) -> HTMLParser:
+        """
+        Parse the html unless it was already parsed.
+
+        Returns:
+            HTMLParser: The parsed html, the same tree is returned on every call.
+        """
+        if self._parser is None:
+            # a utf-8 body is parsed as is, which skips both re-encoding the str and the encoding detection
+            self._parser = HTMLParser(self.utf8_body, detect_encoding=False) if self.utf8_body is not None \
+                else HTMLParser(self.html)
+            # the bytes are only needed to build the tree, don't keep a second copy of the body around
+            self.utf8_body = None
+        return self._parser
 
     def __eq__(self, other):
         if isinstance(other, ScrapedResponse):
+            # compare the cheap fields first so the html is only compared when everything else matches
             return (
-                    self.html == other.html and
-                    self.status_code == other.status_code and
                     self.url == other.url and
-                    self.href_elements == other.href_elements
+                    self.status_code == other.status_code and
+                    self.href_elements == other.href_elements and
+                    self.html == other.html
             )
         return False
 
     def __hash__(self):
-        return hash((self.html, self.status_code, self.url))
+        return hash((self.url, self.status_code))
 
 
 # this if for a future feature where we can try to get different states of a page event
@@ -53,7 +110,13 @@ class ResponseLoader:
 
     _max_responses = 60
     _max_renders = 5
+
+    _max_response_bytes = 10 * 1024 * 1024
+    _read_chunk_size = 64 * 1024
     _event_dispatcher: EventDispatcher = None
+    _skip_scraping: Callable[[str], bool] = None
+    _session: aiohttp.ClientSession = None
+    _dns_cache_ttl = 300
 
     _response_semaphore = asyncio.Semaphore(_max_responses)
     _render_semaphore = asyncio.Semaphore(_max_renders)
@@ -65,8 +128,33 @@ class ResponseLoader:
     _logger = CLogger("ResponseLoader", logging.INFO, {logging.StreamHandler(): logging.INFO})
 
     @classmethod
-    def setup(cls, event_dispatcher: EventDispatcher) -> None:
+    def setup(cls, event_dispatcher: EventDispatcher, skip_scraping: Callable[[str], bool] = None) -> None:
+        """
+        Set up the response loader.
+
+        Args:
+            event_dispatcher (EventDispatcher): The dispatcher the "new_responses" event is triggered on.
+            skip_scraping (Callable[[str], bool]): Optional predicate, urls it returns True for are still
+                crawled but left out of the "new_responses" event.
+        """
         cls._event_dispatcher = event_dispatcher
+        cls._skip_scraping = skip_scraping
+
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """
+        Get the client session shared by all requests, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: The shared client session.
+
+        Note:
+            Sharing the session keeps connections alive and reuses the DNS cache between requests.
+        """
+        if cls._session is None or cls._session.closed:
+            connector = aiohttp.TCPConnector(limit=cls._max_responses, ttl_dns_cache=cls._dns_cache_ttl)
+            cls._session = aiohttp.ClientSession(connector=connector)
+        return cls._session
 
     @staticmethod
     def normalize_url(url: str) -> str:
@@ -79,16 +167,7 @@ class ResponseLoader:
         Returns:
             str: The normalized URL.
         """
-        components = urlsplit(url)
-        normalized_components = [
-            components.scheme.lower(),
-            components.netloc.lower(),
-            components.path,
-            components.query,
-            components.fragment
-        ]
-        normalized_url = urlunsplit(normalized_components)
-        return normalized_url
+        return _normalize_url(url)
 
     @classmethod
     async def wait_for_page_load(cls, page: Page, timeout_time: float = 30) -> None:
@@ -161,32 +240,87 @@ class ResponseLoader:
             return ScrapedResponse(html, status_code, href_elements=hrefs_elements, page=page, url=url)
 
     @classmethod
-    async def get_response(cls, url: str, timeout_time: float = 30) -> ScrapedResponse:
+    async def get_response(cls, url: str, timeout_time: float = 30, max_bytes: int = None) -> ScrapedResponse:
         """
         Get the text response content of a web page.
 
         Args:
             url (str): The URL of the web page.
             timeout_time (float) Maximum operation time in seconds, defaults to 30 seconds
+            max_bytes (int): Maximum size of the body to read, defaults to `_max_response_bytes`.
 
         Returns:
             str: The text response content.
+
+        Note:
+            The body is streamed in chunks and truncated once it exceeds `max_bytes`. It is decoded with the
+            charset from the Content-Type header, or with the encoding the parser detects when there is none.
         """
+        max_bytes = max_bytes or cls._max_response_bytes
+
         async with cls._response_semaphore:
             timeout = ClientTimeout(total=timeout_time)
+            session = cls._get_session()
+
+            async with session.get(url, timeout=timeout) as response:
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(cls._read_chunk_size):
+                    body.extend(chunk)
+                    if len(body) > max_bytes:
+                        cls._logger.warning(f"Response body exceeded {max_bytes} bytes, truncating: {url}")
+                        del body[max_bytes:]
+                        break
+
+                # an unknown charset in the header is treated like a missing one
+                encoding = cls._get_codec_name(response.charset, default=None)
+                if encoding:
+                    html = body.decode(encoding, errors='replace')
+
+                    utf8_body = bytes(body) if encoding == 'utf-8' else None
+                    return ScrapedResponse(html, response.status, url=url, utf8_body=utf8_body)
+
+                # without a usable charset in the header the parser detects the encoding from the bytes and any
+                # <meta charset>, the html is then decoded with the encoding it detected
+                parser = HTMLParser(bytes(body))
+                html = body.decode(cls._get_codec_name(parser.input_encoding), errors='replace')
+                return ScrapedResponse(html, response.status, url=url, parser=parser)
+
+    @staticmethod
+    def _get_codec_name(encoding: Optional[str], default: Optional[str] = 'utf-8') -> Optional[str]:
+        """
+        Get the python codec name for an encoding from a header or detected by the parser.
+
+        Args:
+            encoding (Optional[str]): The encoding name.
+            default (Optional[str]): Returned when the encoding is missing or python doesn't know it.
+
+        Returns:
+            Optional[str]: The codec name, or the default.
+        """
+        if not encoding:
+            return default
+
+        try:
+            return codecs.lookup(encoding).name
+        except LookupError:
+            return default
 
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url) as response:
-                    html = await response.text()
-                    return ScrapedResponse(html, response.status, url=url)
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Close the shared client session.
+        """
+        if cls._session and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
 
     @classmethod
-    async def load_responses(cls, urls: Set[str], render_pages: bool = False) -> Dict[str, ScrapedResponse]:
+    async def load_responses(cls, urls: Iterable[str], render_pages: bool = False) -> Dict[str, ScrapedResponse]:
         """
         Load and retrieve responses from the specified URLs.
 
         Args:
-            *urls: Variable-length arguments representing the URLs to load responses from.
+            urls (Iterable[str]): The URLs to load responses from.
             render_pages (bool): Whether to render pages with JavaScript (default is False).
 
         Returns:
@@ -194,15 +328,21 @@ class ResponseLoader:
 
         Note:
             This method loads responses from the provided URLs. If rendering pages is enabled, it will render pages
-            with JavaScript. The method triggers a "new_responses" event with the loaded response data.
+            with JavaScript. The method triggers a "new_responses" event with the parsed html of each response, the
+            same tree is reused by the crawler when it collects the child urls. Urls rejected by the
+            `skip_scraping` predicate are left out of the event.
+
+            Responses are parsed as soon as they arrive, but both the event data and the returned dictionary
+            follow the order of `urls`, so the scraped output doesn't depend on which fetch finished first.
         """
+        urls = list(urls)
 
         response_method = cls.get_rendered_response if render_pages \
             else cls.get_response
         tasks = [response_method(url) for url in urls]
 
-        results = {}
-        html_responses = []
+        completed = {}
+        skip_scraping = cls._skip_scraping
         async for result in cls._generate_responses(tasks, urls):
             url, scraped_response = result
 
@@ -212,10 +352,15 @@ class ResponseLoader:
                 cls._logger.warning(f"Bad response: {url}")
                 continue
 
-            html_responses.append({url: scraped_response.html})
-            results.update({url: scraped_response})
+            # parse while the remaining fetches are still in flight
+            scraped_response.parse()
+            completed[url] = scraped_response
 
-        ResponseLoader._event_dispatcher.sync_trigger(PEvent("new_responses", EventType.Base, data=html_responses))
+        results = {url: completed[url] for url in urls if url in completed}
+        parsed_responses = [{url: response.parser} for url, response in results.items()
+                            if not (skip_scraping and skip_scraping(url))]
+
+        ResponseLoader._event_dispatcher.sync_trigger(PEvent("new_responses", EventType.Base, data=parsed_responses))
         return results
 
     @classmethod
@@ -233,12 +378,11 @@ class ResponseLoader:
         if not href:
             return ""
 
-        url = urljoin(base_url, href)
-        return cls.normalize_url(url)
+        return _build_link(base_url, href)
 
     @staticmethod
     def get_domain(url: str) -> str:
-        return urlparse(url).netloc
+        return _get_domain(url)
 
     @classmethod
     async def collect_hrefs_with_elements(cls, page: Page) -> List[Locator]:
@@ -254,26 +398,40 @@ class ResponseLoader:
         """
         href_elements_locator = page.locator('a[href]')
 
-        hrefs_to_click = []
-        for href_element in await href_elements_locator.all():
-            href = await href_element.get_attribute('href')
-
-            if href in cls._hrefs_values_to_click:
-                hrefs_to_click.append(href_element)
+        # read every href in a single round trip and only build locators for the matching anchors
+        indices = await page.eval_on_selector_all(
+            'a[href]',
+            "(elements, values) => elements"
+            ".map((element, index) => values.includes(element.getAttribute('href')) ? index : -1)"
+            ".filter(index => index >= 0)",
+            list(cls._hrefs_values_to_click)
+        )
 
-        return hrefs_to_click
+        return [href_elements_locator.nth(index) for index in indices]
 
     @classmethod
-    def get_hrefs_from_html(cls, html: str) -> Generator[str, Any, Any]:
-        parser = HTMLParser(html)
-        for a_tag in parser.css("a"):
+    def get_hrefs_from_html(cls, html: Union[str, HTMLParser]) -> Generator[str, Any, Any]:
+        """
+        Generate the hrefs of the anchor tags in the html, skipping the ones that need to be clicked.
+
+        Args:
+            html (Union[str, HTMLParser]): The raw html or an already parsed tree.
+
+        Yields:
+            str: The href values.
+        """
+        parser = html if isinstance(html, HTMLParser) else HTMLParser(html)
+        hrefs_to_click = cls._hrefs_values_to_click
+
+        # tags() walks the tree directly, avoiding the css selector engine for a plain tag name
+        for a_tag in parser.tags("a"):
             href = a_tag.attributes.get("href")
-            if href in cls._hrefs_values_to_click:
+            if not href or href in hrefs_to_click:
                 continue
             yield href
 
     @classmethod
-    async def _generate_responses(cls, tasks: List[Coroutine[None, None, ScrapedResponse]], urls: Set[str]) -> \
+    async def _generate_responses(cls, tasks: List[Coroutine[None, None, ScrapedResponse]], urls: Iterable[str]) -> \
             AsyncGenerator[Tuple[str, ScrapedResponse], None]:
         """
         Generate responses form a list of tasks and URLs.
@@ -284,15 +442,30 @@ class ResponseLoader:
 
         Yields:
             Generator[Any, Any, Dict[str, str]]: A generator yielding dictionaries mapping URLs to their response content.
+
+        Note:
+            Responses are yielded in the order they complete, not in the order of `urls`.
         """
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        paired_tasks = [cls._pair_with_url(url, task) for url, task in zip(urls, tasks)]
 
-        for url, response_info in zip(urls, responses):
+        for next_completed in asyncio.as_completed(paired_tasks):
+            url, response_info = await next_completed
             if isinstance(response_info, Exception):
-                cls._logger.error(f"Responses Error: {response_info}")
+                cls._logger.error(f"Responses Error: {response_info}\n URL: {url}")
                 continue
             yield url, response_info
 
+    @staticmethod
+    async def _pair_with_url(url: str, task: Coroutine[None, None, ScrapedResponse]) -> \
+            Tuple[str, Union[ScrapedResponse, Exception]]:
+        """
+        Await a response task and pair the result, or the exception it raised, with its URL.
+        """
+        try:
+            return url, await task
+        except Exception as e:
+            return url, e
+
     @classmethod
     def _log_response(cls, response: ScrapedResponse) -> None:
         message = f"URL={response.url}, Status={response.status_code}"
@@ -1,4 +1,4 @@
-from typing import Generator, List
+from typing import Generator, List, Dict
 from dataclasses import dataclass
 
 from selectolax.parser import Node
@@ -6,11 +6,44 @@ from selectolax.parser import Node
 
 @dataclass
 class ScrapedData:
-    """Class for holding scraped data"""
+    """
+    Class for holding scraped data
+
+    The tags, texts and attrs columns are built once from the nodes on first access, so consumers that only
+    need one of them can iterate a plain list instead of going through the Node objects.
+
+    An instance is created for every url and element pair, so the class uses slots instead of a per instance
+    dict, the lazy columns are kept in their own slots.
+    """
+    __slots__ = ('url', 'nodes', 'target_element_id', '_tags', '_texts', '_attrs')
+
     url: str
     nodes: List[Node]
     target_element_id: int
 
+    def __post_init__(self):
+        self._tags: List[str] = None
+        self._texts: List[str] = None
+        self._attrs: List[Dict[str, str]] = None
+
+    @property
+    def tags(self) -> List[str]:
+        if self._tags is None:
+            self._tags = [node.tag for node in self.nodes]
+        return self._tags
+
+    @property
+    def texts(self) -> List[str]:
+        if self._texts is None:
+            self._texts = [node.text() for node in self.nodes]
+        return self._texts
+
+    @property
+    def attrs(self) -> List[Dict[str, str]]:
+        if self._attrs is None:
+            self._attrs = [node.attributes for node in self.nodes]
+        return self._attrs
+
     def get_nodes(self) -> Generator[Node, None, None]:
         for node in self.nodes:
             yield node
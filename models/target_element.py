@@ -1,4 +1,5 @@
-from typing import List, Dict, Generator
+from collections import defaultdict
+from typing import List, Dict, Generator, Optional
 from dataclasses import dataclass
 
 
@@ -7,6 +8,29 @@ class TargetElement:
     name: str
     element_id: int
     search_hierarchy: List[str] = None
+    stepwise_search: bool = False
+
+    @property
+    def combined_selector(self) -> Optional[str]:
+        """
+        Join the search hierarchy into a single descendant selector.
+
+        Returns:
+            Optional[str]: The descendant selector, or None when the hierarchy has to be searched one level
+                at a time, either because the element asks for it or because a level is a selector list.
+
+        Example:
+        search_hierarchy = ['.grandparent', '.parent.someother_class', '.child']
+        # Output: '.grandparent .parent.someother_class .child'
+        """
+        if self.stepwise_search or not self.search_hierarchy:
+            return None
+
+        # a selector list can't be joined, '.a, b .c' would only scope the last selector of the list
+        if any(',' in selector for selector in self.search_hierarchy):
+            return None
+
+        return ' '.join(self.search_hierarchy)
 
     @staticmethod
     def collect_attributes(attributes: List[Dict[str, str]]) -> Dict[str, str]:
@@ -37,7 +61,7 @@ class TargetElement:
         collect_attributes(attributes)
         # Output: {'class': 'btn active', 'id': 'submit-button'}
         """
-        attr = {}
+        attr = defaultdict(list)
         for attribute in attributes:
             name = attribute.get("name", "")
             value = attribute.get("value", "None")
@@ -50,10 +74,7 @@ class TargetElement:
                 else:
                     raise ValueError(f"Improperly formatted attributes, missing value or name: {attribute}")
 
-            if name in attr:
-                attr[name].append(value)
-            else:
-                attr[name] = [value]
+            attr[name].append(value)
 
         return {k: ' '.join(v) for k, v in attr.items()}
 
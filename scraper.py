@@ -9,6 +9,12 @@ from scraping.data_scraper import DataScraper
 from loaders.config_loader import ConfigLoader
 from loaders.response_loader import ResponseLoader
 
+# uvloop is optional, the scraper falls back to the default asyncio loop when it isn't installed (e.g. on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # TODO: (FEATURE) add a feature to scrape multiple of the same element
 
 
@@ -31,19 +37,24 @@ async def load_and_scrape_data(config_path: str) -> None:
     DataScraper(config, elements, event_dispatcher)
     DataParser(config, event_dispatcher, data_saver)
 
-    # Set up the ResponseLoader
-    ResponseLoader.setup(event_dispatcher=event_dispatcher)
+    # Set up the ResponseLoader, target urls that only scrape sub pages are never sent to the scraper
+    ResponseLoader.setup(event_dispatcher=event_dispatcher, skip_scraping=config.only_scrape_sub_pages)
 
     # Start and wait for crawlers to finish
     for crawler in config.get_crawlers():
         crawler.start()
         await crawler.exit()
 
+    await ResponseLoader.close()
     await event_dispatcher.close()
+    await data_saver.close()
 
 def main():
     print("STARTING...")
 
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     asyncio.run(load_and_scrape_data('configs/books.toscrape.com.json'))
     # asyncio.run(load_and_scrape_data('configs/scrap_this_site.com/Oscar_Winning_Films_AJAX_and_Javascript.json'))
 
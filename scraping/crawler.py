@@ -2,7 +2,9 @@ import asyncio
 import logging
 import re
 
-from typing import List, Any, Generator, Iterable, Set, Dict
+from functools import lru_cache
+from collections import deque
+from typing import List, Any, Generator, Iterable, Set, Dict, Deque
 from urllib.robotparser import RobotFileParser
 
 from playwright.async_api import Locator
@@ -26,7 +28,10 @@ class Crawler:
     loop (asyncio.AbstractEventLoop, optional): Custom event loop to use. If not provided,
         a new event loop will be created. Defaults to None.
     user_agent (str, optional): User-Agent string for requests. Defaults to "*".
+    crawl_concurrency (int, optional): How many URLs are requested together between two crawl delays.
+        Ignored when the crawl delay comes from robots.txt, which is then honored per request. Defaults to 8.
     """
+    _ROOT_URL_PATTERN = re.compile(r'^https?://([^/]+)')
 
     def __init__(self,
                  seed: str,
@@ -37,7 +42,8 @@ class Crawler:
                  ignore_robots_txt: bool = False,
                  render_pages: bool = False,
                  url_patters: List[str] = None,
-                 user_agent: str = "*"):
+                 user_agent: str = "*",
+                 crawl_concurrency: int = 8):
 
         self.seed = seed
         self.allowed_domains = allowed_domains
@@ -46,22 +52,29 @@ class Crawler:
         self.render_pages = render_pages
         self.crawl_delay = crawl_delay
         self.user_agent = user_agent
-        self.url_patterns = url_patters
+        self.url_patterns = tuple(url_patters or ())
+        self.crawl_concurrency = crawl_concurrency
 
         self._current_depth = 0
         self._loop = None
-        self._to_visit = set()
+        # the frontier is a FIFO queue so pages are crawled in BFS order, the set mirrors it for membership checks
+        self._to_visit: Deque[str] = deque()
+        self._to_visit_set: Set[str] = set()
         self._visited = set()
         self._clicked_elements = set()
         self._running_tasks = set()
+        self._compiled_url_patterns = ()
+        self._allowed_domains = frozenset(allowed_domains or ())
+        self._batch_size = crawl_concurrency
 
         self._response_with_href_elements: Set[ScrapedResponse] = set()
         self._processed_href_locators: Set[Locator] = set()
+        self._processed_href_urls: Set[str] = set()
 
-        # robot.txt parser
+        # robot.txt parser, the file itself is fetched asynchronously once the crawler runs
         self._robot_parser = RobotFileParser()
         self._robot_parser.set_url(self._get_robot_txt_url())
-        self._robot_parser.read()
+        self._can_fetch = lru_cache(maxsize=4096)(self._robot_parser.can_fetch)
 
         # set event loop
         self._set_event_loop(loop=loop)
@@ -82,13 +95,15 @@ class Crawler:
         """
         Start the crawling process.
         """
-        if not self.ignore_robots_txt:
-            crawl_delay = self._robot_parser.crawl_delay(self.user_agent)
-            # if the robot.txt file specifies a crawl delay use it else use the one specified by the user
-            self.crawl_delay = crawl_delay if crawl_delay else self.crawl_delay
+        self._batch_size = max(1, self.crawl_concurrency)
+
+        # compile the url patterns and freeze the allowed domains here rather than in __init__ as the
+        # crawler options can be deserialized onto the instance after it was created
+        self._compiled_url_patterns = tuple(re.compile(pattern) for pattern in (self.url_patterns or ()))
+        self._allowed_domains = frozenset(self.allowed_domains or ())
 
         # add the initial link to the to-vist set
-        self._to_visit.add(self.seed)
+        self._enqueue(self.seed)
 
         task = self._loop.create_task(self._run())
         self._running_tasks.add(task)
@@ -114,66 +129,116 @@ class Crawler:
 
         Yields:
             str:  URLs that meet the specified conditions.
+
+        Note:
+            Yielded URLs are not marked as visited, that happens once they are popped from the to-visit queue.
         """
+        seen = set()
         for base_url, response in zip(urls, scraped_responses):
             # iterate through each href in the html
-            for href in ResponseLoader.get_hrefs_from_html(response.html):
+            for href in ResponseLoader.get_hrefs_from_html(response.parser):
                 child_url = ResponseLoader.build_link(base_url, href)
-                if child_url not in self._visited and self._is_url_allowed(child_url):
+                if child_url in seen or child_url in self._visited or child_url in self._to_visit_set:
+                    continue
+                seen.add(child_url)
+
+                if self._is_url_allowed(child_url):
                     yield child_url
-                self._visited.add(child_url)
 
     async def _run(self):
         """
         Internal method to perform the crawling asynchronously.
         """
+        if not self.ignore_robots_txt:
+            await self._read_robots_txt()
+            crawl_delay = self._robot_parser.crawl_delay(self.user_agent)
+            # if the robot.txt file specifies a crawl delay use it, one request at a time, else use the one
+            # specified by the user
+            if crawl_delay:
+                self.crawl_delay = crawl_delay
+                self._batch_size = 1
+
         await BrowserManager.initialize(self.render_pages)
 
-        new_urls = set()
+        # a dict is used as an insertion ordered set
+        new_urls = {}
         while self._to_visit and self._current_depth <= self.max_depth:
             # Log crawler status
             self._logger.info(f"DEPTH {self._current_depth}")
 
-            # populate structure with all the urls to get responses from
-            urls_to_get_responses_from = {self._to_visit.pop()} if self.has_crawl_delay else self._to_visit
+            # populate structure with all the urls to get responses from, with a crawl delay the urls are
+            # requested in batches with the delay between each batch
+            urls_to_get_responses_from = self._pop_batch(self._batch_size if self.has_crawl_delay else None)
 
             response_pairs = await ResponseLoader.load_responses(
                 urls_to_get_responses_from,
                 render_pages=self.render_pages
             )
 
-            # if there's no crawl delay that means we sent all the urls to vist to be
-            # processed, so we can clear the set
-            if not self.has_crawl_delay:
-                self._to_visit.clear()
-            else:
+            if self.has_crawl_delay:
                 await asyncio.sleep(self.crawl_delay)
 
             # Process responses
             await self._process_responses(response_pairs)
 
-            new_urls.update(
-                self.collect_child_urls_from_responses(response_pairs.keys(), response_pairs.values())
-            )
+            # collect the child urls in the order the urls were requested, not in the order they completed
+            fetched_urls = [url for url in urls_to_get_responses_from if url in response_pairs]
+            new_urls.update(dict.fromkeys(
+                self.collect_child_urls_from_responses(fetched_urls, (response_pairs[url] for url in fetched_urls))
+            ))
 
             if self.render_pages:
                 await self._collect_button_redirect()
 
             if not self._to_visit:
                 # Once we have processed all the URLs in _to_visit, copy over all the new URLs and increase the depth
-                self._to_visit.update(new_urls)
+                for url in new_urls:
+                    if url not in self._visited:
+                        self._enqueue(url)
                 self._current_depth += 1
                 new_urls.clear()
 
+    def _enqueue(self, url: str) -> None:
+        """
+        Add a URL to the end of the to-visit queue unless it is already queued.
+
+        Args:
+            url (str): The URL to visit.
+        """
+        if url not in self._to_visit_set:
+            self._to_visit_set.add(url)
+            self._to_visit.append(url)
+
+    def _pop_batch(self, batch_size: int = None) -> List[str]:
+        """
+        Pop the next batch of URLs to visit and mark them as visited.
+
+        Args:
+            batch_size (int): Maximum number of URLs to pop, pops every queued URL if None.
+
+        Returns:
+            List[str]: The URLs taken from the front of the to-visit queue.
+
+        Note:
+            URLs are marked as visited before they are requested, so a URL whose request fails is not
+            queued and requested again when later pages link to it.
+        """
+        if batch_size is None:
+            batch_size = len(self._to_visit)
+
+        batch = [self._to_visit.popleft() for _ in range(min(batch_size, len(self._to_visit)))]
+        self._to_visit_set.difference_update(batch)
+        self._visited.update(batch)
+        return batch
+
     async def _process_responses(self, response_pairs: Dict[str, ScrapedResponse]) -> None:
         """
-        Process the responses and update crawled data and visited URLs.
+        Process the responses and update crawled data.
 
         Args:
             response_pairs (Dict[str, ScrapedResponse]): A dictionary of URL-response pairs to process.
         """
-        for url, response_info in response_pairs.items():
-            self._visited.add(url)
+        for response_info in response_pairs.values():
             # if there are elements that need to be clicked and at least 1 of them
             # are unique, put href elements in the click set
             if response_info.href_elements and await self._has_unique_locator(response_info):
@@ -188,10 +253,9 @@ class Crawler:
         Clicks on all the buttons and puts the url they lead to into the to_vist set
         """
 
-        collected_href_locators = [element for rwh_elements in self._response_with_href_elements for element in
-                                   rwh_elements.href_elements]
-
-        self._processed_href_locators.update(collected_href_locators)
+        for response in self._response_with_href_elements:
+            self._processed_href_locators.update(response.href_elements)
+            self._processed_href_urls.update(locator.page.url for locator in response.href_elements)
 
         # while there is response with elements to click
         while len(self._response_with_href_elements):
@@ -202,7 +266,7 @@ class Crawler:
                 await click_element.click()
 
                 if click_element.page.url not in self._visited:
-                    self._to_visit.add(click_element.page.url)
+                    self._enqueue(click_element.page.url)
 
             # the page has clicked through all its elements and can now be reused
             await BrowserManager.close_page(scraped_response.page, feed_into_pool=True)
@@ -218,15 +282,34 @@ class Crawler:
            bool: True if the provided `ScrapedResponse` has at least one unique `Locator` in its `href_elements`,
            False otherwise. Duplicate elements are removed from the `href_elements` during the check.
         """
-        P_LOCATOR_URLS = {p_locator.page.url for p_locator in self._processed_href_locators}
+        scraped_response.href_elements = [locator for locator in scraped_response.href_elements
+                                          if locator.page.url not in self._processed_href_urls]
+        return len(scraped_response.href_elements) > 0
 
-        unique_locators = []
-        for locator in scraped_response.href_elements:
-            if locator.page.url not in P_LOCATOR_URLS:
-                unique_locators.append(locator)
+    async def _read_robots_txt(self) -> None:
+        """
+        Fetch and parse the robots.txt file without blocking the event loop.
 
-        scraped_response.href_elements = unique_locators
-        return len(scraped_response.href_elements) > 0
+        Note:
+            Follows RobotFileParser.read for 4xx statuses, a 401 or 403 disallows every URL and any other 4xx
+            allows every URL. A 5xx status or a failed fetch means robots.txt is unreachable and every URL is
+            disallowed (RFC 9309), which matches RobotFileParser.read leaving the parser unread.
+        """
+        robots_txt_url = self._get_robot_txt_url()
+        try:
+            response = await ResponseLoader.get_response(robots_txt_url)
+        except Exception as e:
+            self._logger.warning(f"Failed to fetch robots.txt, disallowing all urls: {e}\n URL: {robots_txt_url}")
+            response = None
+
+        if response is None or response.status_code >= 500 or response.status_code in (401, 403):
+            self._robot_parser.disallow_all = True
+        elif 400 <= response.status_code < 500:
+            self._robot_parser.allow_all = True
+        else:
+            self._robot_parser.parse(response.html.splitlines())
+
+        self._can_fetch.cache_clear()
 
     def _set_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         """
@@ -252,12 +335,13 @@ class Crawler:
         Returns:
             str: The URL to the robot.txt file.
         """
-        root_url = re.match(r'^https?://([^/]+)', self.seed).group(0)
+        root_url = self._ROOT_URL_PATTERN.match(self.seed).group(0)
         return f"{root_url}/robots.txt" if root_url else ""
 
     def _is_url_allowed(self, url: str) -> bool:
         """
-        Check if the given URL is allowed for scraping.
+        Check if the given URL is allowed for scraping, it has to be on an allowed domain, match one of the
+        url patterns if any are defined, and be allowed by robots.txt.
 
         Args:
             url (str): The URL to check.
@@ -265,36 +349,14 @@ class Crawler:
         Returns:
             bool: True if the URL is allowed; otherwise, False.
         """
-        if self._is_url_allowed_by_patterns(url) and self._is_url_allowed_by_domain(url):
-            return self._is_url_allowed_robot(url)
-        return False
-
-    def _is_url_allowed_by_patterns(self, url: str) -> bool:
-        """
-        Check if the URL matches any of the defined patterns.
-
-        Args:
-            url (str): The URL to check.
-
-        Returns:
-            bool: True if the URL matches a pattern or no patterns are defined; otherwise, False.
-        """
-        if not self.url_patterns:
-            return True
-
-        return any(re.search(pattern, url) for pattern in self.url_patterns)
-
-    def _is_url_allowed_by_domain(self, url: str) -> bool:
-        """
-        Check if the domain of the given URL is in the set of allowed domains.
+        # the checks are ordered from cheapest to most expensive so most urls are rejected early
+        if ResponseLoader.get_domain(url) not in self._allowed_domains:
+            return False
 
-        Args:
-            url (str): The URL to check.
+        if self._compiled_url_patterns and not any(pattern.search(url) for pattern in self._compiled_url_patterns):
+            return False
 
-        Returns:
-            bool: True if the domain is allowed; otherwise, False.
-        """
-        return ResponseLoader.get_domain(url) in self.allowed_domains
+        return self._is_url_allowed_robot(url)
 
     def _is_url_allowed_robot(self, url: str) -> bool:
         """
@@ -308,7 +370,7 @@ class Crawler:
         """
         if self.ignore_robots_txt:
             return True
-        return self._robot_parser.can_fetch(self.user_agent, url)
+        return self._can_fetch(self.user_agent, url)
 
     def __repr__(self):
         return (
@@ -1,6 +1,7 @@
 import re
 import logging
 
+from functools import lru_cache
 from typing import Generator, Tuple, List
 from selectolax.parser import Node
 
@@ -31,14 +32,13 @@ class DataParser:
 
             for node in scraped_data.get_nodes():
                 if parsing_data.get("collect_text"):
-                    text = self.collect_text(node)
-                    cleaned_data.append(text)
+                    cleaned_data.append(self.collect_text(node))
                 elif parsing_data.get("remove_tags"):
                     cleaned_data.append(self.remove_tags(node))
 
                 attr_data = parsing_data.get("collect_attr_value")
                 if attr_data and attr_data.get('attr_name'):
-                    cleaned_data.append(self.collect_attribute_value(str(node.unwrap()), attr_data['attr_name']))
+                    cleaned_data.append(self.collect_node_attribute_value(node, attr_data['attr_name']))
                 elif attr_data and not attr_data.get('attr_name'):
                     self.log_missing_attribute_name(attr_data)
 
@@ -51,18 +51,28 @@ class DataParser:
 
     @staticmethod
     def collect_attribute_value(attr_name, element_text: str):
-        match = re.search(f'{attr_name}="([^"]*)"', element_text)
+        match = DataParser._attribute_regex(attr_name).search(element_text)
         if match:
             return match.group(1)
         return ""
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _attribute_regex(attr_name: str) -> re.Pattern:
+        return re.compile(f'{re.escape(attr_name)}="([^"]*)"')
+
+    @staticmethod
+    def collect_node_attribute_value(node: Node, attr_name: str) -> str:
+        return node.attributes.get(attr_name) or ""
+
     @staticmethod
     def collect_text(node: Node) -> str:
         return node.text().strip()
 
     @staticmethod
     def remove_tags(node: Node) -> str:
-        return str(node.unwrap())
+        # serialize the children instead of unwrapping, unwrap() mutates the parsed tree and returns None
+        return ''.join(child.html for child in node.iter(include_text=True))
 
     def log_missing_attribute_name(self, attr_data: dict) -> None:
         error_message = (
@@ -1,8 +1,10 @@
 import aiofiles
+import csv
+import io
 import logging
 
 from asyncio import Lock
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Tuple
 
 from utils.clogger import CLogger
 
@@ -21,13 +23,14 @@ class DataSaver:
         :param save_config: Dict which specifies how the data should be saved
         :param: data_keys: List of keys in order which will be used to save the data
         """
+        self._logger = CLogger("DataSaver", logging.INFO, {logging.StreamHandler(): logging.INFO})
+
         self._lock = Lock()
+        self._csv_file = None
         self.data_keys = data_keys
         self.save_config = save_config
         self.save_types = []
 
-        self._initialize_save_types()
-
         self._save_func_mapping = {
             'csv': self.save_csv,
             'txt': self.save_txt,
@@ -38,21 +41,18 @@ class DataSaver:
             'csv': self.clear_csv
         }
 
-        self._logger = CLogger("DataSaver", logging.INFO, {logging.StreamHandler(): logging.INFO})
+        # (save function, save options, total items) for every known save type, resolved once
+        self._save_plan: Tuple[Tuple[Callable, Dict[Any, Any], int], ...] = ()
+
+        self._initialize_save_types()
 
     async def setup(self, clear: bool = False) -> None:
         if clear:
             # clear all the files that where specified in the config file
             self._clear_file()
 
-        for save_type in self.save_types:
-            save_func = self._save_func_mapping.get(save_type)
-
-            if not save_func:
-                self._logger.warning(f"Unknown save type: {save_type}")
-                continue
-
-            await save_func(self.save_config.get(save_type), self.data_keys, len(self.data_keys), self._lock)
+        for save_func, save_options, t_items in self._save_plan:
+            await save_func(save_options, self.data_keys, t_items, self._lock)
 
     async def save(self, data: Any) -> None:
         """
@@ -60,14 +60,16 @@ class DataSaver:
 
         :param data: Data to be saved
         """
-        for save_type in self.save_types:
-            save_func = self._save_func_mapping.get(save_type)
+        for save_func, save_options, t_items in self._save_plan:
+            await save_func(save_options, data, t_items, self._lock)
 
-            if not save_func:
-                self._logger.warning(f"Unknown save type: {save_type}")
-                continue
-
-            await save_func(self.save_config.get(save_type), data, len(self.data_keys), self._lock)
+    async def close(self) -> None:
+        """
+        Close the files that were kept open for saving
+        """
+        if self._csv_file:
+            await self._csv_file.close()
+            self._csv_file = None
 
     @staticmethod
     def clear_csv(clear_data: Dict[Any, Any]) -> None:
@@ -79,10 +81,10 @@ class DataSaver:
         with open(file_path, "w") as file:
             file.truncate(0)
 
-    @staticmethod
-    async def save_csv(csv_options: Dict[Any, Any], data: Any, t_items: int, lock: Lock) -> None:
+    async def save_csv(self, csv_options: Dict[Any, Any], data: Any, t_items: int, lock: Lock) -> None:
         """
-        Data is saved in a csv file based on the specified options
+        Data is saved in a csv file based on the specified options, the file is opened on the first save and
+        kept open until `close` is called
 
         :param lock:
         :param t_items: how many total items there are
@@ -106,20 +108,21 @@ class DataSaver:
             if orientation not in ALLOWED_ORIENTATIONS:
                 raise ValueError(f"Unknown orientation: {orientation}, allowed orientations are => {ALLOWED_ORIENTATIONS} ")
 
-            ordered_data = [[] for _ in range(t_items)]
-
-            for index, item in enumerate(ordered_data):
-                item.extend(data[index::len(ordered_data)])
+            if self._csv_file is None:
+                self._csv_file = await aiofiles.open(csv_file_path, mode='a', newline='')
 
-            async with aiofiles.open(csv_file_path, mode='a', newline='') as csv_file:
+            if orientation == 'horizontal':
+                # One row per data key, taken with strided slices
+                rows = [data[index::t_items] for index in range(t_items)]
+            else:
+                # One row per record, grouping consecutive items without building the columns first,
+                # an incomplete trailing record is dropped
+                rows = zip(*[iter(data)] * t_items)
 
-                if orientation == 'horizontal':
-                    # Write the rows as-is
-                    await csv_file.writelines([','.join(row) + '\n' for row in ordered_data])
-                else:
-                    # Transpose the data and write it
-                    transposed_data = [list(row) for row in zip(*ordered_data)]
-                    await csv_file.writelines([','.join(row) + '\n' for row in transposed_data])
+            # the csv writer quotes values containing commas, quotes or newlines
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator='\n').writerows(rows)
+            await self._csv_file.write(buffer.getvalue())
 
     @staticmethod
     async def save_txt(txt_options: Dict[Any, Any], data: Any, t_items: int, lock: Lock) -> None:
@@ -145,11 +148,22 @@ class DataSaver:
 
     def _initialize_save_types(self):
         """
-        Initialize save types based on the save configurations
+        Initialize save types and the save plan based on the save configurations, unknown save types are
+        reported once here
         """
         if self.save_types:
             return
 
+        save_plan = []
         for save_type in self.save_config:
             self.save_types.append(save_type)
 
+            save_func = self._save_func_mapping.get(save_type)
+            if not save_func:
+                self._logger.warning(f"Unknown save type: {save_type}")
+                continue
+
+            save_plan.append((save_func, self.save_config.get(save_type), len(self.data_keys)))
+
+        self._save_plan = tuple(save_plan)
+
@@ -1,5 +1,5 @@
-from typing import List, Dict
-from selectolax.parser import HTMLParser
+from typing import List, Dict, Generator, Iterable
+from selectolax.parser import HTMLParser, Node
 
 from EVNTDispatch import EventDispatcher, PEvent, EventType
 from loaders.config_loader import ConfigLoader
@@ -28,35 +28,22 @@ class DataScraper:
 
     def collect_data(self, event: PEvent) -> None:
         """
-        (OUT DATED DOC)
         Collect data from the responses obtained by the response loader.
 
         Args:
-            event (Event): The event triggered with the responses' data.
+            event (Event): The event triggered with the responses' data, a list of url to parsed html mappings.
         """
         responses = event.data
 
-        all_scraped_data = []
-        for response in responses:
-            scraped_data = self._process_response(response)
-            all_scraped_data.extend(scraped_data)
+        all_scraped_data = [scraped_data for response in responses for scraped_data in self._process_response(response)]
 
         self.event_dispatcher.async_trigger_nw(PEvent("scraped_data", EventType.Base, data=all_scraped_data))
 
-    def _process_response(self, response: Dict[str, str]) -> List[ScrapedData]:
-        results = []
-
-        for url, content in response.items():
-            parser = HTMLParser(content)
-
-            if self.config.only_scrape_sub_pages(url):
-                continue
-
+    def _process_response(self, response: Dict[str, HTMLParser]) -> Generator[ScrapedData, None, None]:
+        # target urls that only scrape sub pages are filtered out by the ResponseLoader before the event
+        for url, parser in response.items():
             for element in self.elements:
-                scraped_data = self.collect_all_target_elements(url, element, parser)
-                results.append(scraped_data)
-
-        return results
+                yield self.collect_all_target_elements(url, element, parser)
 
     @staticmethod
     def collect_all_target_elements(url: str, target_element: TargetElement, parser: HTMLParser) -> ScrapedData:
@@ -71,18 +58,38 @@ class DataScraper:
         Returns:
             ScrapedData: An instance containing the collected data.
         """
-        result_set = parser.css(
-            target_element.search_hierarchy[0]) if target_element.search_hierarchy else []
+        search_hierarchy = target_element.search_hierarchy
+        if not search_hierarchy:
+            return ScrapedData(url, [], target_element.element_id)
+
+        # most elements are a single css selector or attribute set, those need neither joining nor descending
+        if len(search_hierarchy) == 1:
+            return ScrapedData(url, parser.css(search_hierarchy[0]), target_element.element_id)
+
+        # a single descendant selector lets the selector engine walk the tree once instead of
+        # calling css() on every node matched by the previous level
+        combined_selector = target_element.combined_selector
+        if combined_selector:
+            return ScrapedData(url, parser.css(combined_selector), target_element.element_id)
 
-        if len(target_element.search_hierarchy) <= 1:
-            return ScrapedData(url, result_set, target_element.element_id)
+        # chain the levels lazily, only the last level is materialized
+        result_set = parser.css(search_hierarchy[0])
+        for attr in search_hierarchy[1:]:
+            result_set = DataScraper._descend(result_set, attr)
 
-        for attr in target_element.search_hierarchy[1:]:
-            new_result_set = []
-            for tag in result_set:
-                temp_result_set = tag.css(attr)
-                if temp_result_set:
-                    new_result_set.extend(temp_result_set)
-            result_set = new_result_set
+        return ScrapedData(url, list(result_set), target_element.element_id)
 
-        return ScrapedData(url, result_set, target_element.element_id)
+    @staticmethod
+    def _descend(tags: Iterable[Node], css_selector: str) -> Generator[Node, None, None]:
+        """
+        Generate the nodes matching the css selector within each of the tags.
+
+        Args:
+            tags (Iterable[Node]): The nodes matched by the previous level of the search hierarchy.
+            css_selector (str): The css selector of the next level.
+
+        Yields:
+            Node: The matching nodes.
+        """
+        for tag in tags:
+            yield from tag.css(css_selector)
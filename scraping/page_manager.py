@@ -1,12 +1,18 @@
-from asyncio import Queue, Lock
+import asyncio
+import logging
+
+from asyncio import Queue, QueueFull
 from typing import Set
 from playwright.async_api import Browser, async_playwright, Page
 
+from utils.clogger import CLogger
+
 
 class PagePool:
-    _pool: Queue = Queue()
     _max_size = 5  # Set a reasonable maximum pool size
-    _lock = Lock()
+    # the queue is bounded by the pool size and synchronizes every get and put on its own
+    _pool: Queue = Queue(maxsize=_max_size)
+    _is_populated: bool = False
 
     @classmethod
     def get_pool(cls) -> Queue:
@@ -18,19 +24,29 @@ class PagePool:
 
     @classmethod
     async def populate_pool(cls, total_items) -> None:
-        async with cls._lock:
-            # Ensure we don't exceed the maximum pool size
-            total_items = min(total_items, cls._max_size)
-
-            for _ in range(total_items):
-                page = await BrowserManager.create_new_page()
-                cls._pool.put_nowait(page)
+        # the flag is set before the first await, so concurrent callers can only populate the pool once
+        if cls._is_populated:
+            return
+        cls._is_populated = True
+
+        # Ensure we don't exceed the maximum pool size
+        total_items = min(total_items, cls._max_size)
+
+        # every page owns its context, creating them concurrently overlaps the browser round trips
+        try:
+            pages = await asyncio.gather(*(BrowserManager.create_new_page() for _ in range(total_items)))
+        except BaseException:
+            # allow a later call to populate the pool, the pages that were created stay tracked as active
+            # pages and are closed with the browser
+            cls._is_populated = False
+            raise
+
+        for page in pages:
+            cls._pool.put_nowait(page)
 
     @classmethod
     async def get_page(cls) -> Page:
-        async with cls._lock:
-            # if not cls._pool.empty():
-            return await cls._pool.get()
+        return await cls._pool.get()
 
     # return await BrowserManager.create_new_page()
 
@@ -55,35 +71,59 @@ class PagePool:
             ```
 
         """
-        async with cls._lock:
-            if page is None:
-                return False
+        if page is None:
+            return False
 
-            # Check if the pool is full
-            if cls.is_full():
-                return False
+        # Check if the pool is full
+        if cls.is_full():
+            return False
 
-            # Prepare the page for reuse
-            await page.context.clear_cookies()
-            await page.context.clear_permissions()
+        # Prepare the page for reuse
+        await page.context.clear_cookies()
+        await page.context.clear_permissions()
 
-            await cls._pool.put(page)
+        # another page may have filled the pool while this one was being cleared
+        try:
+            cls._pool.put_nowait(page)
+        except QueueFull:
+            return False
 
-            return True
+        return True
 
     @classmethod
-    def set_pool_size(cls, pool_size: int) -> None:
+    async def set_pool_size(cls, pool_size: int) -> None:
+        """
+        Set the maximum pool size, the pages already in the pool are kept up to the new size and the
+        pages that no longer fit are closed.
+
+        Args:
+            pool_size (int): The maximum number of pages the pool holds.
+        """
+        pool = Queue(maxsize=pool_size)
+        overflow = []
+        while not cls._pool.empty():
+            page = cls._pool.get_nowait()
+            if pool.full():
+                overflow.append(page)
+            else:
+                pool.put_nowait(page)
+
         cls._max_size = pool_size
+        cls._pool = pool
+
+        # pooled pages are not tracked as active pages, so nothing else would ever close them
+        await asyncio.gather(*(page.close() for page in overflow), return_exceptions=True)
 
     @classmethod
     def is_full(cls) -> bool:
-        return cls._pool.qsize() >= cls._max_size
+        return cls._pool.full()
 
 
 class BrowserManager:
     _browser: Browser = None
     _all_pages: Set[Page] = set()
-    _lock: Lock = Lock()
+
+    _logger = CLogger("BrowserManager", logging.INFO, {logging.StreamHandler(): logging.INFO})
 
     @classmethod
     async def initialize(cls, is_rendering: bool = False):
@@ -93,8 +133,7 @@ class BrowserManager:
 
     @classmethod
     def remove_from_active_pages(cls, page: Page) -> None:
-        if page in cls._all_pages:
-            cls._all_pages.remove(page)
+        cls._all_pages.discard(page)
 
     @classmethod
     async def create_new_page(cls) -> Page:
@@ -113,13 +152,14 @@ class BrowserManager:
         while not pool.empty():
             pages_in_pool.add(pool.get_nowait())
 
-        for page in cls._all_pages:
-            if page not in pages_in_pool:
-                # Close pages that are not in the pool
-                await page.close()
-            else:
-                # Return pages to the pool
-                pool.put_nowait(page)
+        # Return pages to the pool, pages that were fed back into the pool are no longer tracked as active
+        for page in pages_in_pool:
+            pool.put_nowait(page)
+
+        # Close pages that are not in the pool, the closes are independent so they are sent together
+        pages_to_close = cls._all_pages - pages_in_pool
+        cls._all_pages -= pages_to_close
+        await asyncio.gather(*(page.close() for page in pages_to_close), return_exceptions=True)
 
     @classmethod
     async def get_browser(cls, headless: bool = False) -> Browser:
@@ -130,9 +170,8 @@ class BrowserManager:
 
     @classmethod
     async def close(cls):
-        for page in cls._all_pages:
-            await page.close()
-        cls._all_pages.clear()
+        pages, cls._all_pages = cls._all_pages, set()
+        await asyncio.gather(*(page.close() for page in pages), return_exceptions=True)
 
         if cls._browser:
             await cls._browser.close()
@@ -177,19 +216,19 @@ class BrowserManager:
             ```
 
         """
-        async with cls._lock:
-            if feed_into_pool and not PagePool.is_full():
-                if await PagePool.put_page_back(page):
-                    print("RETURN SUCCESS:", page)
-                    cls.remove_from_active_pages(page)
-            elif not feed_into_pool:
-                print("CLOSING PAGE:", page)
-                cls.remove_from_active_pages(page)
-                await page.close()
-            elif PagePool.is_full():
-                print("FULL POOL")
-                cls.remove_from_active_pages(page)
-                await page.close()
+        if page is None:
+            return
+
+        # put_page_back already refuses pages when the pool is full, so it is the only check needed
+        if feed_into_pool and await PagePool.put_page_back(page):
+            # lazy %-formatting, the page is only formatted when debug logging is enabled
+            cls._logger.debug("Returned page to the pool: %s", page)
+            cls.remove_from_active_pages(page)
+            return
+
+        cls._logger.debug("Closing page%s: %s", ", pool is full" if feed_into_pool else "", page)
+        cls.remove_from_active_pages(page)
+        await page.close()
 
     @staticmethod
     async def get_page() -> Page:
@@ -12,6 +12,8 @@ setup(
         'aiofiles~=23.2.1',
         'EVNTDispatch~=0.0.2',
         'requests~=2.28.2',
+        'orjson~=3.8.3',
+        'uvloop~=0.17.0; sys_platform != "win32"',
     ],
     packages=find_packages()
 )
@@ -0,0 +1,56 @@
+import unittest
+
+from typing import Dict, Iterable
+from unittest.mock import patch
+
+from loaders.response_loader import ResponseLoader, ScrapedResponse
+from scraping.crawler import Crawler
+
+
+class TestCrawler(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.root = "http://site.test"
+        # every page links to the next depth and to a dead link that never returns a response
+        self.pages = {
+            f"{self.root}/{depth}": f'<a href="/{depth + 1}">next</a><a href="/dead">dead</a>'
+            for depth in range(5)
+        }
+        self.requested = []
+
+    async def load_responses(self, urls: Iterable[str], render_pages: bool = False) -> Dict[str, ScrapedResponse]:
+        results = {}
+        for url in urls:
+            self.requested.append(url)
+            # failed requests are left out of the results, like ResponseLoader does
+            if url in self.pages:
+                results[url] = ScrapedResponse(self.pages[url], 200, url=url)
+        return results
+
+    async def test_failed_url_is_requested_once(self):
+        crawler = Crawler(f"{self.root}/0", ["site.test"], max_depth=5, crawl_delay=0, ignore_robots_txt=True)
+
+        with patch.object(ResponseLoader, "load_responses", self.load_responses):
+            crawler.start()
+            await crawler.exit()
+
+        self.assertEqual(1, self.requested.count(f"{self.root}/dead"))
+        self.assertEqual(len(self.requested), len(set(self.requested)))
+
+    async def test_unreachable_robots_txt_disallows_all_urls(self):
+        async def server_error(url: str, *args, **kwargs) -> ScrapedResponse:
+            return ScrapedResponse("<html>Service Unavailable</html>", 503, url=url)
+
+        async def connection_error(url: str, *args, **kwargs) -> ScrapedResponse:
+            raise ConnectionError(url)
+
+        for get_response in (server_error, connection_error):
+            crawler = Crawler(f"{self.root}/0", ["site.test"])
+
+            with patch.object(ResponseLoader, "get_response", get_response):
+                await crawler._read_robots_txt()
+
+            self.assertFalse(crawler._is_url_allowed_robot(f"{self.root}/1"))
+
+
+if __name__ == '__main__':
+    unittest.main()
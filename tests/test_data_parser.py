@@ -0,0 +1,34 @@
+import unittest
+
+from selectolax.parser import HTMLParser
+
+from scraping.data_parser import DataParser
+
+
+class TestDataParser(unittest.TestCase):
+    def setUp(self) -> None:
+        self.html = """
+               <div class="parent">
+                 <a class="link" href="x" data-id='5'>LINK <b>TEXT</b></a>
+               </div>
+               """
+
+        self.html_parser = HTMLParser(self.html)
+        self.node = self.html_parser.css_first('a')
+
+    def test_collect_attribute_value_from_html(self):
+        self.assertEqual('x', DataParser.collect_attribute_value('href', '<a href="x">'))
+        self.assertEqual('', DataParser.collect_attribute_value('src', '<a href="x">'))
+
+    def test_collect_node_attribute_value(self):
+        self.assertEqual('x', DataParser.collect_node_attribute_value(self.node, 'href'))
+        self.assertEqual('5', DataParser.collect_node_attribute_value(self.node, 'data-id'))
+        self.assertEqual('', DataParser.collect_node_attribute_value(self.node, 'src'))
+
+    def test_remove_tags_keeps_tree_intact(self):
+        self.assertEqual('LINK <b>TEXT</b>', DataParser.remove_tags(self.node))
+        self.assertIsNotNone(self.html_parser.css_first('a.link'))
+
+
+if __name__ == '__main__':
+    unittest.main()
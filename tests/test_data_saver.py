@@ -0,0 +1,39 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from scraping.data_saver import DataSaver
+
+
+class TestDataSaver(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.value = 'a, "b"\nc'
+        self.data_keys = ['first', 'second']
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.file_path = os.path.join(temp_dir.name, 'output.csv')
+
+    async def save_csv(self, orientation: str) -> list:
+        data_saver = DataSaver({'csv': {'file_path': self.file_path, 'orientation': orientation}}, self.data_keys)
+        await data_saver.setup(clear=True)
+        await data_saver.save([self.value, 'plain'])
+        await data_saver.close()
+
+        with open(self.file_path, newline='') as csv_file:
+            return list(csv.reader(csv_file))
+
+    async def test_save_csv_vertical_quotes_special_characters(self):
+        rows = await self.save_csv('vertical')
+
+        self.assertEqual([self.value, 'plain'], rows[-1])
+
+    async def test_save_csv_horizontal_quotes_special_characters(self):
+        rows = await self.save_csv('horizontal')
+
+        self.assertEqual([[self.value], ['plain']], rows[-2:])
+
+
+if __name__ == '__main__':
+    unittest.main()
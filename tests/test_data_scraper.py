@@ -73,6 +73,26 @@ class TestDataScraper(unittest.TestCase):
 
         self.assertEqual(first_node.attributes.get('class', ''), 'parent someother_class')
 
+    def test_collecting_elements_using_stepwise_search_hierarchy(self):
+        hierarchy = TargetElement.create_search_hierarchy_from_raw_hierarchy(self.search_hierarchy_raw)
+        target_element = TargetElement("test_element", 0, hierarchy, stepwise_search=True)
+
+        self.assertIsNone(target_element.combined_selector)
+
+        scraped_data = DataScraper.collect_all_target_elements(self.url, target_element, self.html_parser)
+
+        self.assertEqual(1, len(scraped_data.nodes))
+        self.assertEqual(scraped_data.nodes[0].text().strip(), "CHILD ELEMENT")
+
+    def test_selector_list_is_not_combined(self):
+        target_element = TargetElement("test_element", 0, ['.grandparent', '.child, .parent'])
+
+        self.assertIsNone(target_element.combined_selector)
+
+        scraped_data = DataScraper.collect_all_target_elements(self.url, target_element, self.html_parser)
+
+        self.assertEqual(3, len(scraped_data.nodes))
+
 
 if __name__ == '__main__':
     unittest.main()
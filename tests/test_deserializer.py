@@ -0,0 +1,45 @@
+import unittest
+
+from utils.deserializer import Deserializer
+
+
+class Person:
+    name = ""
+
+    def __init__(self):
+        self.age = 0
+
+
+class Options:
+    def __init__(self, extended: bool = False):
+        self.a = 0
+        if extended:
+            self.b = 0
+
+
+class TestDeserializer(unittest.TestCase):
+    def test_deserialize_instance(self):
+        person = Deserializer.deserialize(Person(), {"age": 30, "unknown": True})
+
+        self.assertEqual(30, person.age)
+        self.assertFalse(hasattr(person, "unknown"))
+
+    def test_class_and_instance_fields_are_cached_separately(self):
+        Deserializer.deserialize(Person, {"name": "John"})
+        person = Deserializer.deserialize(Person(), {"age": 5})
+
+        self.assertEqual("John", Person.name)
+        self.assertEqual(5, person.age)
+
+        Deserializer.deserialize(Person, {"age": 9})
+        self.assertFalse(hasattr(Person, "age"))
+
+    def test_instance_fields_are_read_from_each_instance(self):
+        Deserializer.deserialize(Options(), {"a": 1})
+        options = Deserializer.deserialize(Options(extended=True), {"b": 2})
+
+        self.assertEqual(2, options.b)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from asyncio import Queue
+from unittest.mock import patch
+
+from scraping.page_manager import PagePool, BrowserManager
+
+
+class PageStub:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestPagePool(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        PagePool._max_size = 5
+        PagePool._pool = Queue(maxsize=PagePool._max_size)
+        PagePool._is_populated = False
+
+    async def test_shrinking_pool_closes_overflow_pages(self):
+        pages = [PageStub() for _ in range(3)]
+        for page in pages:
+            PagePool.get_pool().put_nowait(page)
+
+        await PagePool.set_pool_size(1)
+
+        self.assertEqual(1, PagePool.t_active_pages())
+        self.assertEqual([False, True, True], [page.closed for page in pages])
+
+    async def test_failed_populate_can_be_retried(self):
+        async def failing_page() -> PageStub:
+            raise RuntimeError("browser closed")
+
+        async def new_page() -> PageStub:
+            return PageStub()
+
+        with patch.object(BrowserManager, "create_new_page", failing_page):
+            with self.assertRaises(RuntimeError):
+                await PagePool.populate_pool(2)
+
+        with patch.object(BrowserManager, "create_new_page", new_page):
+            await PagePool.populate_pool(2)
+
+        self.assertEqual(2, PagePool.t_active_pages())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from unittest.mock import patch
+
+from loaders.response_loader import ResponseLoader, ScrapedResponse
+
+
+class EventDispatcherStub:
+    def __init__(self):
+        self.events = []
+
+    def sync_trigger(self, event) -> None:
+        self.events.append(event)
+
+
+class TestResponseLoader(unittest.IsolatedAsyncioTestCase):
+    async def test_responses_follow_url_order(self):
+        # the first url finishes last, the event and the results still follow the order of the urls
+        delays = {"http://site.test/0": 0.03, "http://site.test/1": 0.02, "http://site.test/2": 0.01}
+
+        async def get_response(url: str, *args, **kwargs) -> ScrapedResponse:
+            await asyncio.sleep(delays[url])
+            return ScrapedResponse(f"<p>{url}</p>", 200, url=url)
+
+        dispatcher = EventDispatcherStub()
+        ResponseLoader.setup(dispatcher)
+
+        with patch.object(ResponseLoader, "get_response", get_response):
+            results = await ResponseLoader.load_responses(iter(delays))
+
+        self.assertEqual(list(delays), list(results))
+        self.assertEqual(list(delays), [url for response in dispatcher.events[0].data for url in response])
+
+    async def test_unknown_header_charset_falls_back_to_detection(self):
+        body = '<html><head><meta charset="windows-1252"></head><body><p>café</p></body></html>'.encode('cp1252')
+
+        async def handler(request: web.Request) -> web.Response:
+            return web.Response(body=body, headers={'Content-Type': 'text/html; charset=x-bogus'})
+
+        app = web.Application()
+        app.router.add_get('/', handler)
+
+        async with TestServer(app) as server:
+            try:
+                response = await ResponseLoader.get_response(str(server.make_url('/')))
+            finally:
+                await ResponseLoader.close()
+
+        self.assertEqual(200, response.status_code)
+        self.assertIn('café', response.html)
+        self.assertEqual('café', response.parser.css_first('p').text())
+
+    def test_utf8_body_is_released_once_parsed(self):
+        response = ScrapedResponse('<p>café</p>', 200, url="http://site.test", utf8_body='<p>café</p>'.encode())
+
+        self.assertEqual('café', response.parser.css_first('p').text())
+        self.assertIsNone(response.utf8_body)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,4 @@
-from typing import Type, Any
+from typing import Type, Any, Dict, FrozenSet
 
 
 class Deserializer:
@@ -27,6 +27,9 @@ class Deserializer:
         print(person_obj.name)  # Output: "John"
         print(person_obj.age)   # Output: 30
     """
+    # the settable fields of a class are resolved once, an instance's fields depend on what its __init__ set
+    # so they are read from the instance every time
+    _fields_cache: Dict[type, FrozenSet[str]] = {}
 
     @staticmethod
     def deserialize(cls: Any, json_data: dict) -> Type:
@@ -42,11 +45,35 @@ class Deserializer:
         if json_data is None:
             return cls
 
-        p_fields = [attr for attr in cls.__dict__ if
-                    not callable(getattr(cls, attr)) and not attr.startswith("__")]
+        p_fields = Deserializer._get_fields(cls)
 
-        for j_field in json_data:
+        for j_field, value in json_data.items():
             if j_field in p_fields:
-                cls.__setattr__(j_field, json_data[j_field])
+                setattr(cls, j_field, value)
 
         return cls
+
+    @staticmethod
+    def _get_fields(cls: Any) -> FrozenSet[str]:
+        """Get the names of the non callable, non dunder attributes that can be deserialized.
+
+        Args:
+            cls (Type): The class type or instance the JSON data will be deserialized into.
+
+        Returns:
+            FrozenSet[str]: The settable field names, cached for classes.
+        """
+        if not isinstance(cls, type):
+            return Deserializer._collect_fields(cls)
+
+        p_fields = Deserializer._fields_cache.get(cls)
+        if p_fields is None:
+            p_fields = Deserializer._collect_fields(cls)
+            Deserializer._fields_cache[cls] = p_fields
+
+        return p_fields
+
+    @staticmethod
+    def _collect_fields(cls: Any) -> FrozenSet[str]:
+        return frozenset(attr for attr in cls.__dict__ if
+                         not callable(getattr(cls, attr)) and not attr.startswith("__"))